@@ -6,15 +6,21 @@ pattern to ensure a single, consistent repository instance within the applicatio
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
 from requests import Response
 
 from exceptions.bridge_exception import BridgeException
+from network.http import BridgeHttpAdapter
 from utils.file_handler import FileHandler
 from utils.status_code import StatusCode
 
+_STATUS_OK = StatusCode.OK.value
+
 
 # pylint: disable=too-few-public-methods
 class BridgeRepository:
@@ -26,8 +32,10 @@ class BridgeRepository:
     It also facilitates the registration of the application to obtain a username and client key for authentication.
 
     Attributes:
-        _headers (dict[str, str]): Headers to be used for HTTP requests.
         _base_url (str): The base URL for the Philips Hue Bridge API requests.
+        _session (requests.Session): A persistent session with a pooled HTTPS adapter so repeated
+            requests to the Bridge reuse the same TCP/TLS connection. Request headers live on the
+            session, so there is a single header dict shared by every request.
 
     Methods:
         _set_base_url: Sets the base URL for API requests.
@@ -41,22 +49,37 @@ class BridgeRepository:
         fetch_bridge_data: Fetches various information about the Bridge.
     """
 
+    # Registration results per bridge base URL, shared by every repository instance so repeated
+    # discoveries in one process skip both the auth file and the network round trip.
+    _key_cache: dict[str, tuple[str, str]] = {}
+
+    # Aggregated bridge data per IP address with its fetch time. Name, software version and ids
+    # change rarely, so rediscoveries within the TTL skip all five metadata round trips.
+    _bridge_data_cache: dict[str, tuple[dict, float]] = {}
+    _BRIDGE_DATA_TTL: float = 300.0
+
     def __init__(self):
-        self._headers: dict[str, str] = {
-            "Content-Type": "application/json",
-            "hue-application-key": "",
-        }
         self._base_url: str = ""
+        self._has_base_url: bool = False
+        self._auth_data: dict[str, Any] | None = None
+        self._session: requests.Session = requests.Session()
+        self._session.mount(
+            "https://", BridgeHttpAdapter(pool_connections=4, pool_maxsize=16)
+        )
+        self._session.verify = False
+        self._session.headers.update(
+            {"Content-Type": "application/json", "hue-application-key": ""}
+        )
 
     def get_headers(self) -> dict[str, str]:
         """
         Retrieves the headers used for HTTP requests to the Philips Hue Bridge.
 
         Returns:
-            dict[str, str]: A dictionary containing the headers for HTTP requests.
+            dict[str, str]: The session's header mapping used for HTTP requests.
         """
 
-        return self._headers
+        return self._session.headers
 
     def set_headers(self, headers: dict[str, str]):
         """
@@ -66,7 +89,8 @@ class BridgeRepository:
             headers (dict[str, str]): A dictionary containing the headers to be set for HTTP requests.
         """
 
-        self._headers = headers
+        self._session.headers.clear()
+        self._session.headers.update(headers)
 
     def get_base_url(self) -> str:
         """
@@ -87,6 +111,7 @@ class BridgeRepository:
         """
 
         self._base_url = f"https://{ip_address}"
+        self._has_base_url = bool(ip_address)
 
     def _load_auth_data(self) -> dict[str, Any]:
         """
@@ -96,6 +121,9 @@ class BridgeRepository:
         with the Philips Hue Bridge. The authentication data typically includes credentials like username
         and client key.
 
+        The parsed data is cached in memory after the first read, so repeated calls within the same
+        process skip both the file system access and the JSON parsing.
+
         Returns:
             dict: A dictionary containing authentication data such as username and client key. The dictionary
             will be empty if the file does not exist or is empty.
@@ -104,7 +132,9 @@ class BridgeRepository:
             The file path is obtained from the FileHandler.AUTH_FILE_PATH constant.
         """
 
-        return FileHandler.read_json(FileHandler.AUTH_FILE_PATH)
+        if self._auth_data is None:
+            self._auth_data = FileHandler.read_json(FileHandler.AUTH_FILE_PATH)
+        return self._auth_data
 
     def _save_auth_data(self, data: dict):
         """
@@ -121,6 +151,7 @@ class BridgeRepository:
             it will be created.
         """
         logging.debug("saving data: %s", data)
+        self._auth_data = data
         FileHandler.write_json(FileHandler.AUTH_FILE_PATH, data)
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Response:
@@ -141,20 +172,19 @@ class BridgeRepository:
             BridgeException: If the response status code indicates an error.
         """
 
-        if self._base_url == "https://":
+        if not self._has_base_url:
             raise ValueError("Base url is not set.")
         url = f"{self._base_url}{endpoint}"
-        logging.debug("headers: %s", self._headers)
-        response = requests.request(
-            method, url, headers=self._headers, verify=False, timeout=5, **kwargs
-        )
-        if response.status_code != StatusCode.OK.value:
+        logging.debug("headers: %s", self._session.headers)
+        response = self._session.request(method, url, timeout=5, **kwargs)
+        if response.status_code != _STATUS_OK:
             raise BridgeException(
                 f"Response status: {response.status_code}, {response.reason}"
             )
 
         logging.debug("response-headers: %s", response.headers)
-        logging.debug("response-body: %s", response.json())
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("response-body: %s", response.text[:1024])
         return response
 
     def _register_app_and_fetch_username_client_key(self) -> tuple[str, str]:
@@ -171,17 +201,25 @@ class BridgeRepository:
 
         logging.info("Registering app and fetching username/client key")
 
+        cached = BridgeRepository._key_cache.get(self._base_url)
+        if cached:
+            return cached
+
         try:
             auth_data = self._load_auth_data()
             if auth_data:
-                return auth_data["username"], auth_data["clientkey"]
+                username, client_key = auth_data["username"], auth_data["clientkey"]
+                BridgeRepository._key_cache[self._base_url] = (username, client_key)
+                return username, client_key
         except FileNotFoundError as e:
             logging.warning("No existing username data at: %s", e)
 
         response = self._make_request(
-            "POST", "/api", json={"devicetype": "hep#1", "generateclientkey": True}
+            "POST",
+            "/api",
+            data=orjson.dumps({"devicetype": "hep#1", "generateclientkey": True}),
         )
-        data = response.json()[0]
+        data = orjson.loads(response.content)[0]
 
         if not data:
             raise BridgeException("Did not return any username or client key.")
@@ -190,6 +228,7 @@ class BridgeRepository:
             raise BridgeException(f"Bridge error: {data['error']['description']}")
         username, client_key = data["success"]["username"], data["success"]["clientkey"]
         self._save_auth_data({"username": username, "clientkey": client_key})
+        BridgeRepository._key_cache[self._base_url] = (username, client_key)
         return username, client_key
 
     def _fetch_swversion(self) -> int:
@@ -202,7 +241,7 @@ class BridgeRepository:
 
         logging.info("Fetching Bridge software version")
         response = self._make_request("GET", "/api/config")
-        return int(response.json()["swversion"])
+        return int(orjson.loads(response.content)["swversion"])
 
     def _fetch_hue_application_id(self) -> str:
         """
@@ -229,7 +268,7 @@ class BridgeRepository:
 
         logging.info("Fetching Bridge Name")
         response = self._make_request("GET", f"/clip/v2/resource/device/{rid}")
-        return response.json()["data"][0]["metadata"]["name"]
+        return orjson.loads(response.content)["data"][0]["metadata"]["name"]
 
     def _fetch_bridge_id_and_rid(self) -> tuple[str, str]:
         """
@@ -241,7 +280,7 @@ class BridgeRepository:
 
         logging.info("Fetching Bridge ID and RID")
         response = self._make_request("GET", "/clip/v2/resource/bridge")
-        data = response.json()["data"][0]
+        data = orjson.loads(response.content)["data"][0]
         return data["id"], data["owner"]["rid"]
 
     def _fetch_bridge_rid(self) -> str:
@@ -254,7 +293,7 @@ class BridgeRepository:
 
         logging.info("Fetching Bridge RID")
         response = self._make_request("GET", "/clip/v2/resource/bridge")
-        return response.json()["data"][0]["owner"]["rid"]
+        return orjson.loads(response.content)["data"][0]["owner"]["rid"]
 
     def fetch_bridge_data(self, address: str) -> dict:
         """
@@ -277,6 +316,11 @@ class BridgeRepository:
         if not address:
             raise ValueError("No IP address provided for bridge data fetching.")
 
+        cached = BridgeRepository._bridge_data_cache.get(address)
+        if cached and time.monotonic() - cached[1] < self._BRIDGE_DATA_TTL:
+            logging.debug("Serving bridge data for %s from cache", address)
+            return cached[0]
+
         self.set_base_url(address)
 
         username, client_key = self._register_app_and_fetch_username_client_key()
@@ -284,17 +328,23 @@ class BridgeRepository:
             raise ValueError("Username is empty.")
 
         logging.info("username: %s, clientkey: %s", username, client_key)
-        if not self._headers["hue-application-key"]:
-            self._headers["hue-application-key"] = username
+        if not self._session.headers["hue-application-key"]:
+            self._session.headers["hue-application-key"] = username
 
         identification, rid = self._fetch_bridge_id_and_rid()
         logging.info("id: %s, rid: %s", identification, rid)
 
-        name = self._fetch_bridge_name(rid)
+        # The remaining three fetches are independent of each other, so run them concurrently
+        # over the pooled session instead of paying three sequential round trips.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            name_future = executor.submit(self._fetch_bridge_name, rid)
+            swversion_future = executor.submit(self._fetch_swversion)
+            hue_application_id_future = executor.submit(self._fetch_hue_application_id)
+            name = name_future.result()
+            swversion = swversion_future.result()
+            hue_application_id = hue_application_id_future.result()
         logging.info("name: %s", name)
-        swversion = self._fetch_swversion()
         logging.info("swversion: %s", swversion)
-        hue_application_id = self._fetch_hue_application_id()
         logging.info("hue-application-id: %s", hue_application_id)
 
         data = {
@@ -307,4 +357,5 @@ class BridgeRepository:
             "clientkey": client_key,
             "name": name,
         }
+        BridgeRepository._bridge_data_cache[address] = (data, time.monotonic())
         return data
@@ -16,17 +16,23 @@ Classes:
 """
 
 import logging
+import time
 
+import orjson
 import requests
 from requests import Response
 
 from models.bridge import Bridge
 from models.payload import Payload
 from models.entertainment_configuration import EntertainmentConfiguration
+from network.http import BridgeHttpAdapter
 from exceptions.api_exception import ApiException
 
 from utils.status_code import StatusCode
 
+_STATUS_OK = StatusCode.OK.value
+_STATUS_NOT_MODIFIED = StatusCode.NOT_MODIFIED.value
+
 
 class EntertainmentConfigurationRepository:
     """
@@ -38,13 +44,25 @@ class EntertainmentConfigurationRepository:
     Attributes:
         _bridge (Bridge): Instance of Bridge class for Philips Hue Bridge communication.
         _base_url (str): Base URL for entertainment configuration API requests.
-        _headers (dict[str, str]): HTTP request headers with content type and application key from the Bridge.
+        _headers (dict[str, str]): HTTP request headers with content type and application key from
+            the Bridge, installed on the session once so requests skip the per-call header merge.
+        _session (requests.Session): A persistent session with a pooled HTTPS adapter, so the start/stop
+            and configuration calls reuse one TCP/TLS connection to the Bridge.
+        _url_cache (dict[str, str]): Per-configuration request URLs, built once and reused on every update.
+        _config_cache (dict[str, EntertainmentConfiguration] | None): Configurations from the last fetch,
+            served for up to _CACHE_TTL seconds and invalidated by updates.
+        _config_etag (str | None): ETag of the last fetched configuration response, sent back as
+            If-None-Match so an unchanged catalog revalidates without a body transfer or re-parse.
 
     Methods:
         fetch_configurations: Fetches all entertainment configurations from the Hue Bridge.
         put_configuration: Updates an existing entertainment configuration on the Hue Bridge.
     """
 
+    # Entertainment configurations change rarely next to how often they are read, so fetched
+    # results are served from memory for this many seconds before hitting the Bridge again.
+    _CACHE_TTL: float = 10.0
+
     def __init__(self, bridge: Bridge):
         """
         Initializes the EntertainmentConfigurationRepository with a Philips Hue Bridge.
@@ -60,6 +78,16 @@ class EntertainmentConfigurationRepository:
             "Content-Type": "application/json",
             "hue-application-key": bridge.get_username(),
         }
+        self._session: requests.Session = requests.Session()
+        self._session.mount(
+            "https://", BridgeHttpAdapter(pool_connections=4, pool_maxsize=16)
+        )
+        self._session.verify = False
+        self._session.headers.update(self._headers)
+        self._url_cache: dict[str, str] = {}
+        self._config_cache: dict[str, EntertainmentConfiguration] | None = None
+        self._config_cache_time: float = 0.0
+        self._config_etag: str | None = None
 
     def _send_request(self, method: str, url: str, payload: Payload = None) -> Response:
         """
@@ -80,15 +108,13 @@ class EntertainmentConfigurationRepository:
         logging.info("Sending %s request to %s", method, url)
         if payload:
             logging.debug("Payload: %s", payload.get_data())
-        response = requests.request(
+        response = self._session.request(
             method,
             url,
-            headers=self._headers,
-            json=payload.get_data() if payload else None,
-            verify=False,
+            data=orjson.dumps(payload.get_data()) if payload else None,
             timeout=5,
         )
-        if response.status_code != StatusCode.OK.value:
+        if response.status_code != _STATUS_OK:
             raise ApiException(
                 f"Response status: {response.status_code}, {response.reason}"
             )
@@ -103,12 +129,35 @@ class EntertainmentConfigurationRepository:
             each configuration fetched from the Hue Bridge.
         """
 
+        if (
+            self._config_cache is not None
+            and time.monotonic() - self._config_cache_time < self._CACHE_TTL
+        ):
+            logging.debug("Serving entertainment configurations from cache")
+            return self._config_cache
+
         logging.info("Fetching entertainment configurations")
-        response = self._send_request("GET", self._base_url)
-        data = response.json()["data"]
-        entertainment_configs = {}
-        for item in data:
-            entertainment_configs[item["id"]] = EntertainmentConfiguration(item)
+        extra_headers = None
+        if self._config_etag and self._config_cache is not None:
+            extra_headers = {"If-None-Match": self._config_etag}
+        response = self._session.request(
+            "GET", self._base_url, headers=extra_headers, timeout=5
+        )
+        if response.status_code == _STATUS_NOT_MODIFIED:
+            logging.debug("Entertainment configurations unchanged, reusing cache")
+            self._config_cache_time = time.monotonic()
+            return self._config_cache
+        if response.status_code != _STATUS_OK:
+            raise ApiException(
+                f"Response status: {response.status_code}, {response.reason}"
+            )
+        self._config_etag = response.headers.get("ETag")
+        data = orjson.loads(response.content)["data"]
+        entertainment_configs = {
+            item["id"]: EntertainmentConfiguration(item) for item in data
+        }
+        self._config_cache = entertainment_configs
+        self._config_cache_time = time.monotonic()
         return entertainment_configs
 
     def put_configuration(self, payload: Payload):
@@ -119,7 +168,12 @@ class EntertainmentConfigurationRepository:
             payload (Payload): The payload containing the updated entertainment configuration data.
         """
 
-        url = f"{self._base_url}/{payload.get_id()}"
-        payload.remove_key("id")
-        self._send_request("PUT", url, payload)
+        configuration_id = payload.get_id()
+        url = self._url_cache.get(configuration_id)
+        if url is None:
+            url = f"{self._base_url}/{configuration_id}"
+            self._url_cache[configuration_id] = url
+        body = {k: v for k, v in payload.get_data().items() if k != "id"}
+        self._send_request("PUT", url, Payload(body))
+        self._config_cache = None
         logging.info("Entertainment configuration updated successfully.")
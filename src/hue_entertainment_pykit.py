@@ -14,6 +14,7 @@ their entertainment features need to be dynamically discovered, configured, and
 """
 import logging
 import re
+import time
 from typing import Optional, Union
 
 from bridge.bridge_repository import BridgeRepository
@@ -30,6 +31,20 @@ from services.discovery_service import DiscoveryService
 from services.streaming_service import StreamingService
 from utils.logger import setup_logging
 
+_IP_ADDRESS_PATTERN = re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b")
+
+# Expected type and error message for each create_bridge argument except ip_address, which has
+# its own format validation; ordered to match the function signature.
+_BRIDGE_FIELD_SPEC = (
+    (str, "Identification must be a string"),
+    (str, "Resource ID must be a string"),
+    (int, "Software version must be an integer"),
+    (str, "Username must be a string"),
+    (str, "Hue application ID must be a string"),
+    (str, "Client key must be a string"),
+    (str, "Name must be a string"),
+)
+
 
 def setup_logs(
         level: int = logging.DEBUG,
@@ -86,24 +101,12 @@ def create_bridge(
         Bridge: An instance of the Bridge class configured with the given parameters.
     """
 
-    if not isinstance(identification, str):
-        raise TypeError("Identification must be a string")
-    if not isinstance(rid, str):
-        raise TypeError("Resource ID must be a string")
-    if not isinstance(ip_address, str) or not re.match(
-            r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", ip_address
-    ):
+    values = (identification, rid, swversion, username, hue_app_id, clientkey, name)
+    for value, (expected_type, error_message) in zip(values, _BRIDGE_FIELD_SPEC):
+        if not isinstance(value, expected_type):
+            raise TypeError(error_message)
+    if not isinstance(ip_address, str) or not _IP_ADDRESS_PATTERN.match(ip_address):
         raise ValueError("Invalid IP address format")
-    if not isinstance(swversion, int):
-        raise TypeError("Software version must be an integer")
-    if not isinstance(username, str):
-        raise TypeError("Username must be a string")
-    if not isinstance(hue_app_id, str):
-        raise TypeError("Hue application ID must be a string")
-    if not isinstance(clientkey, str):  # Add specific format check if needed
-        raise TypeError("Client key must be a string")
-    if not isinstance(name, str):
-        raise TypeError("Name must be a string")
 
     return Bridge(
         identification,
@@ -128,8 +131,12 @@ class Discovery:
         _mdns_service (Mdns): An instance of MdnsService for discovering devices using MDNS.
         _bridge_repository (BridgeRepository): Repository for storing and managing bridge devices.
         _discovery_service (DiscoveryService): Service for discovering bridge devices.
+        _cache (dict): Discovery results per requested IP with their discovery time, served for
+            up to _CACHE_TTL seconds so polling callers do not trigger a fresh network sweep.
     """
 
+    _CACHE_TTL = 30.0
+
     def __init__(self):
         """Initializes the Discovery class with necessary service instances."""
 
@@ -138,19 +145,31 @@ class Discovery:
         self._discovery_service = DiscoveryService(
             self._mdns_service, self._bridge_repository
         )
+        self._cache: dict[Optional[str], tuple[float, dict[str, Bridge]]] = {}
 
-    def discover_bridges(self, ip_address: Optional[str] = None) -> dict[str, Bridge]:
+    def discover_bridges(
+            self, ip_address: Optional[str] = None, refresh: bool = False
+    ) -> dict[str, Bridge]:
         """Discovers bridge devices in the network.
 
-        If an IP address is provided, the discovery is limited to that address.
+        If an IP address is provided, the discovery is limited to that address. Results are cached
+        for a short window so repeated calls return instantly instead of re-running the mDNS sweep.
 
         Args:
             ip_address (Optional[str]): The IP address to limit the discovery to. Default is None.
+            refresh (bool): If True, bypasses the cached result and performs a fresh discovery.
 
         Returns:
             dict[str, Bridge]: A dictionary of discovered bridges, keyed by their IP addresses.
         """
-        return self._discovery_service.discover(ip_address)
+
+        if not refresh:
+            cached = self._cache.get(ip_address)
+            if cached and time.monotonic() - cached[0] < self._CACHE_TTL:
+                return cached[1]
+        bridges = self._discovery_service.discover(ip_address)
+        self._cache[ip_address] = (time.monotonic(), bridges)
+        return bridges
 
 
 class Entertainment:
@@ -193,10 +212,7 @@ class Entertainment:
             EntertainmentConfiguration | None: The requested configuration if found, otherwise None.
         """
 
-        for config in self._entertainment_configs.values():
-            if config.id == config_id:
-                return config
-        return None
+        return self.get_entertainment_configs().get(config_id)
 
     def get_ent_conf_repo(self) -> EntertainmentConfigurationRepository:
         """Returns the entertainment configuration repository.
@@ -268,3 +284,22 @@ class Streaming:
         """
 
         self._streaming_service.set_input(input_data)
+
+    def set_inputs(
+            self,
+            input_data: list[
+                Union[tuple[int, int, int, int], tuple[float, float, float, int]]
+            ],
+    ):
+        """Sets input data for multiple lights in one streaming message.
+
+        Accepts a list of tuples in the same formats as set_input. All entries are packed into a
+        single HueStream message, so updating many lights in an Entertainment Area costs one
+        datagram per frame instead of one per light.
+
+        Args:
+            input_data (list[Union[tuple[int, int, int, int], tuple[float, float, float, int]]]):
+                The per-light input tuples to be sent together.
+        """
+
+        self._streaming_service.set_inputs(input_data)
@@ -38,6 +38,17 @@ class Bridge:
 
     # pylint: disable=too-many-positional-arguments
 
+    __slots__ = (
+        "_identification",
+        "_rid",
+        "_ip_address",
+        "_swversion",
+        "_username",
+        "_hue_app_id",
+        "_client_key",
+        "_name",
+    )
+
     def __init__(
         self,
         identification: str = "",
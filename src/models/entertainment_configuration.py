@@ -22,8 +22,10 @@ These classes and enums collectively enable the detailed and flexible representa
 configurations, facilitating the management and customization of lighting setups for entertainment purposes.
 """
 
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from typing import Optional, Any
 
 
@@ -74,7 +76,18 @@ class ProxyMode(Enum):
     MANUAL = "manual"
 
 
-@dataclass
+# Direct value-to-member maps for the enums above. Indexing these skips the Enum.__call__
+# machinery, which is the dominant per-item cost when parsing configurations with many
+# channels and service locations.
+# pylint: disable=protected-access
+_RESOURCE_TYPES = ResourceTypes._value2member_map_
+_CONFIGURATION_TYPES = ConfigurationTypes._value2member_map_
+_STATUS_TYPES = StatusTypes._value2member_map_
+_PROXY_MODES = ProxyMode._value2member_map_
+# pylint: enable=protected-access
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Represents a 3D coordinate position.
@@ -90,7 +103,7 @@ class Position:
     z: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceIdentifier:
     """
     Identifies a specific resource in the Philips Hue system.
@@ -104,7 +117,7 @@ class ResourceIdentifier:
     rtype: ResourceTypes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SegmentReference:
     """
     Represents a reference to a segment of a resource.
@@ -118,7 +131,7 @@ class SegmentReference:
     index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EntertainmentChannel:
     """
     Represents a channel within a Philips Hue Entertainment area.
@@ -134,7 +147,7 @@ class EntertainmentChannel:
     members: list[SegmentReference]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StreamProxyNode:
     """
     Represents a node in a stream proxy configuration.
@@ -148,7 +161,7 @@ class StreamProxyNode:
     rid: str
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamProxy:
     """
     Represents the stream proxy configuration.
@@ -162,7 +175,7 @@ class StreamProxy:
     node: StreamProxyNode
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceLocation:
     """
     Represents the location of a service in a Philips Hue Entertainment area.
@@ -180,7 +193,7 @@ class ServiceLocation:
     equalization_factor: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Locations:
     """
     Represents the locations of services in a Philips Hue Entertainment area.
@@ -192,6 +205,82 @@ class Locations:
     service_locations: list[ServiceLocation]
 
 
+def _position_to_dict(position: Position) -> dict[str, float]:
+    """
+    Serializes a Position into its raw API dictionary form.
+
+    Parameters:
+        position (Position): The position to serialize.
+
+    Returns:
+        dict[str, float]: A dictionary with the x, y and z coordinates.
+    """
+
+    return {"x": position.x, "y": position.y, "z": position.z}
+
+
+def _resource_to_dict(resource: ResourceIdentifier) -> dict[str, Any]:
+    """
+    Serializes a ResourceIdentifier into its raw API dictionary form.
+
+    Parameters:
+        resource (ResourceIdentifier): The resource identifier to serialize.
+
+    Returns:
+        dict[str, Any]: A dictionary with the resource's rtype value and rid.
+    """
+
+    return {"rtype": resource.rtype.value, "rid": resource.rid}
+
+
+def _build_channel(ch: dict[str, Any]) -> EntertainmentChannel:
+    """
+    Builds an EntertainmentChannel from its raw API dictionary.
+
+    Parameters:
+        ch (dict[str, Any]): The raw channel entry from the Bridge response.
+
+    Returns:
+        EntertainmentChannel: The constructed channel with its position and segment members.
+    """
+
+    return EntertainmentChannel(
+        channel_id=ch["channel_id"],
+        position=Position(**ch["position"]),
+        members=[
+            SegmentReference(
+                service=ResourceIdentifier(
+                    rid=sys.intern(member["service"]["rid"]),
+                    rtype=_RESOURCE_TYPES[member["service"]["rtype"]],
+                ),
+                index=member["index"],
+            )
+            for member in ch["members"]
+        ],
+    )
+
+
+def _build_service_location(loc: dict[str, Any]) -> ServiceLocation:
+    """
+    Builds a ServiceLocation from its raw API dictionary.
+
+    Parameters:
+        loc (dict[str, Any]): The raw service location entry from the Bridge response.
+
+    Returns:
+        ServiceLocation: The constructed service location with its positions.
+    """
+
+    return ServiceLocation(
+        service=ResourceIdentifier(
+            rid=sys.intern(loc["service"]["rid"]), rtype=_RESOURCE_TYPES[loc["service"]["rtype"]]
+        ),
+        position=Position(**loc["position"]),
+        positions=[Position(**pos) for pos in loc["positions"]],
+        equalization_factor=loc["equalization_factor"],
+    )
+
+
 class EntertainmentConfiguration:
     """
     Represents the configuration of a Philips Hue Entertainment area.
@@ -209,9 +298,12 @@ class EntertainmentConfiguration:
         configuration_type (ConfigurationTypes): Type of configuration for the Entertainment area.
         metadata (dict[str, Any]): Metadata associated with the Entertainment area.
         stream_proxy (StreamProxy): Stream proxy configuration for the Entertainment area.
-        channels (list[EntertainmentChannel]): Channels in the Entertainment area.
-        locations (Locations): Location configurations for the Entertainment area.
-        light_services (list[ResourceIdentifier]): Light services associated with the Entertainment area.
+        channels (list[EntertainmentChannel]): Channels in the Entertainment area, parsed lazily
+            on first access.
+        locations (Locations): Location configurations for the Entertainment area, parsed lazily
+            on first access.
+        light_services (list[ResourceIdentifier]): Light services associated with the Entertainment
+            area, parsed lazily on first access.
 
     Methods:
         to_dict: Converts the EntertainmentConfiguration instance into a dictionary.
@@ -233,57 +325,70 @@ class EntertainmentConfiguration:
             'metadata', 'stream_proxy', 'channels', 'locations', and 'light_services'.
         """
 
+        get = data.get
         self.id = data["id"]
         self.type = data["type"]
-        self.id_v1 = data.get("id_v1")
-        self.name = data.get("name")
-        self.status = StatusTypes(data["status"])
-        self.configuration_type = ConfigurationTypes(data["configuration_type"])
+        self.id_v1 = get("id_v1")
+        self.name = get("name")
+        self.status = _STATUS_TYPES[data["status"]]
+        self.configuration_type = _CONFIGURATION_TYPES[data["configuration_type"]]
         self.metadata = data["metadata"]
 
         proxy_data = data["stream_proxy"]
+        proxy_node = proxy_data["node"]
         self.stream_proxy = StreamProxy(
-            mode=ProxyMode(proxy_data["mode"]),
+            mode=_PROXY_MODES[proxy_data["mode"]],
             node=StreamProxyNode(
-                rtype=ResourceTypes(proxy_data["node"]["rtype"]), rid=proxy_data["node"]["rid"]
+                rtype=_RESOURCE_TYPES[proxy_node["rtype"]], rid=sys.intern(proxy_node["rid"])
             ),
         )
 
-        self.channels = [
-            EntertainmentChannel(
-                channel_id=ch["channel_id"],
-                position=Position(**ch["position"]),
-                members=[
-                    SegmentReference(
-                        service=ResourceIdentifier(
-                            rid=member["service"]["rid"],
-                            rtype=ResourceTypes(member["service"]["rtype"]),
-                        ),
-                        index=member["index"],
-                    )
-                    for member in ch["members"]
-                ],
-            )
-            for ch in data["channels"]
-        ]
+        self._raw_channels = data["channels"]
+        self._raw_service_locations = data["locations"]["service_locations"]
+        self._raw_light_services = get("light_services", [])
 
-        self.locations = Locations(
-            service_locations=[
-                ServiceLocation(
-                    service=ResourceIdentifier(
-                        rid=loc["service"]["rid"], rtype=ResourceTypes(loc["service"]["rtype"])
-                    ),
-                    position=Position(**loc["position"]),
-                    positions=[Position(**pos) for pos in loc["positions"]],
-                    equalization_factor=loc["equalization_factor"],
-                )
-                for loc in data["locations"]["service_locations"]
-            ]
-        )
+    @cached_property
+    def channels(self) -> list[EntertainmentChannel]:
+        """
+        The channels of the Entertainment area, parsed on first access.
+
+        Returns:
+            list[EntertainmentChannel]: The channels built from the raw configuration data.
+        """
+
+        raw_channels = self._raw_channels
+        channels: list[EntertainmentChannel] = [None] * len(raw_channels)
+        for i, ch in enumerate(raw_channels):
+            channels[i] = _build_channel(ch)
+        return channels
 
-        self.light_services = [
-            ResourceIdentifier(rid=ls["rid"], rtype=ResourceTypes(ls["rtype"]))
-            for ls in data.get("light_services", [])
+    @cached_property
+    def locations(self) -> Locations:
+        """
+        The service locations of the Entertainment area, parsed on first access.
+
+        Returns:
+            Locations: The locations built from the raw configuration data.
+        """
+
+        raw_locations = self._raw_service_locations
+        service_locations: list[ServiceLocation] = [None] * len(raw_locations)
+        for i, loc in enumerate(raw_locations):
+            service_locations[i] = _build_service_location(loc)
+        return Locations(service_locations=service_locations)
+
+    @cached_property
+    def light_services(self) -> list[ResourceIdentifier]:
+        """
+        The light services of the Entertainment area, parsed on first access.
+
+        Returns:
+            list[ResourceIdentifier]: The light service identifiers from the raw configuration data.
+        """
+
+        return [
+            ResourceIdentifier(rid=sys.intern(ls["rid"]), rtype=_RESOURCE_TYPES[ls["rtype"]])
+            for ls in self._raw_light_services
         ]
 
     def to_dict(self) -> dict[str, Any]:
@@ -297,6 +402,8 @@ class EntertainmentConfiguration:
             dict[str, Any]: A dictionary representation of the EntertainmentConfiguration instance.
         """
 
+        stream_proxy = self.stream_proxy
+        node = stream_proxy.node
         return {
             "id": self.id,
             "type": self.type,
@@ -306,22 +413,16 @@ class EntertainmentConfiguration:
             "configuration_type": self.configuration_type.value,
             "metadata": self.metadata,
             "stream_proxy": {
-                "mode": self.stream_proxy.mode.value,
-                "node": {
-                    "rtype": self.stream_proxy.node.rtype.value,
-                    "rid": self.stream_proxy.node.rid,
-                },
+                "mode": stream_proxy.mode.value,
+                "node": {"rtype": node.rtype.value, "rid": node.rid},
             },
             "channels": [
                 {
                     "channel_id": ch.channel_id,
-                    "position": asdict(ch.position),
+                    "position": _position_to_dict(ch.position),
                     "members": [
                         {
-                            "service": {
-                                "rtype": member.service.rtype.value,
-                                "rid": member.service.rid,
-                            },
+                            "service": _resource_to_dict(member.service),
                             "index": member.index,
                         }
                         for member in ch.members
@@ -332,16 +433,16 @@ class EntertainmentConfiguration:
             "locations": {
                 "service_locations": [
                     {
-                        "service": {"rtype": loc.service.rtype.value, "rid": loc.service.rid},
-                        "position": asdict(loc.position),
-                        "positions": [asdict(pos) for pos in loc.positions],
+                        "service": _resource_to_dict(loc.service),
+                        "position": _position_to_dict(loc.position),
+                        "positions": [_position_to_dict(pos) for pos in loc.positions],
                         "equalization_factor": loc.equalization_factor,
                     }
                     for loc in self.locations.service_locations
                 ]
             },
             "light_services": [
-                {"rtype": ls.rtype.value, "rid": ls.rid} for ls in self.light_services
+                _resource_to_dict(ls) for ls in self.light_services
             ],
         }
 
@@ -350,16 +451,29 @@ class EntertainmentConfiguration:
         Compares this EntertainmentConfiguration instance with another object.
 
         This method checks if the provided object is an instance of EntertainmentConfiguration and
-        compares their dictionary representations for equality.
+        compares the instances field by field, short-circuiting on the first mismatch instead of
+        serializing both sides to dictionaries.
 
         Parameters:
             other (Any): The object to compare with.
 
         Returns:
-            bool: True if the other object is an instance of EntertainmentConfiguration and their
-            dictionary representations are equal, False otherwise.
+            bool: True if the other object is an instance of EntertainmentConfiguration with equal
+            fields, False otherwise.
         """
 
         if not isinstance(other, EntertainmentConfiguration):
             return False
-        return self.to_dict() == other.to_dict()
+        return (
+            self.id == other.id
+            and self.type == other.type
+            and self.id_v1 == other.id_v1
+            and self.name == other.name
+            and self.status is other.status
+            and self.configuration_type is other.configuration_type
+            and self.metadata == other.metadata
+            and self.stream_proxy == other.stream_proxy
+            and self.channels == other.channels
+            and self.locations == other.locations
+            and self.light_services == other.light_services
+        )
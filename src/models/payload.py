@@ -19,6 +19,8 @@ class Payload:
         _json_obj (dict): The internal dictionary to store the payload data.
     """
 
+    __slots__ = ("_json_obj",)
+
     def __init__(self, initial_data: dict = None):
         """
         Initializes the Payload object with optional initial data.
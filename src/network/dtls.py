@@ -197,7 +197,7 @@ class Dtls:
             if args and self.type is not socket.SOCK_DGRAM:
                 raise OSError(errno.ENOTCONN, os.strerror(errno.ENOTCONN))
 
-            if len(args) == 0:
+            if not args:
                 flags, address = 0, None
             elif len(args) == 1:
                 flags, address = 0, args[0]
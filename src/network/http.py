@@ -0,0 +1,59 @@
+"""
+This module provides the shared HTTPS plumbing used for communication with the Philips Hue Bridge.
+The Bridge serves its API over HTTPS with a self-signed certificate, so certificate verification is
+disabled. Instead of paying for that setup on every request, this module constructs a single insecure
+SSLContext at import time, reuses it for every pooled connection (which also enables TLS session
+resumption between handshakes), and silences the InsecureRequestWarning that urllib3 would otherwise
+emit on each call.
+
+Classes:
+- BridgeHttpAdapter: An HTTPAdapter that wires the shared SSLContext into its connection pool.
+"""
+
+import ssl
+
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.check_hostname = False
+_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+class BridgeHttpAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that reuses one module-level insecure SSLContext for all pooled connections.
+
+    Sharing the context across connections avoids rebuilding TLS state per request and lets the
+    underlying OpenSSL session cache resume sessions when a connection to the Bridge is reopened.
+    Unless overridden, transient connection errors are retried twice with a short backoff instead of
+    tearing down the pooled connection on the first hiccup.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the adapter with a default retry policy for transient connection errors.
+
+        Parameters:
+            *args: Positional arguments forwarded to HTTPAdapter.
+            **kwargs: Keyword arguments forwarded to HTTPAdapter; max_retries may be supplied to
+            override the default policy.
+        """
+
+        kwargs.setdefault("max_retries", Retry(total=2, backoff_factor=0.1))
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """
+        Initializes the urllib3 pool manager with the shared insecure SSLContext.
+
+        Parameters:
+            *args: Positional arguments forwarded to HTTPAdapter.init_poolmanager.
+            **kwargs: Keyword arguments forwarded to HTTPAdapter.init_poolmanager.
+        """
+
+        kwargs["ssl_context"] = _SSL_CONTEXT
+        super().init_poolmanager(*args, **kwargs)
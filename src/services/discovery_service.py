@@ -7,7 +7,10 @@ streaming support and to load saved bridge data.
 
 import json
 import logging
-import re
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
 import requests
@@ -20,6 +23,27 @@ from network.mdns import Mdns
 from utils.file_handler import FileHandler
 from utils.status_code import StatusCode
 
+_STATUS_OK = StatusCode.OK.value
+
+
+@lru_cache(maxsize=4)
+def _read_bridge_file(file_path: str, _mtime_ns: int):
+    """
+    Reads and parses the bridge data file, memoized per (path, modification time).
+
+    The modification time participates in the cache key, so rewrites of the file naturally
+    invalidate stale entries while back-to-back discoveries reuse the parsed result.
+
+    Parameters:
+        file_path (str): The path of the bridge data file.
+        _mtime_ns (int): The file's modification time in nanoseconds, used only as a cache key.
+
+    Returns:
+        The parsed JSON content of the file.
+    """
+
+    return FileHandler.read_json(file_path)
+
 
 # pylint: disable=too-few-public-methods
 class DiscoveryService:
@@ -41,6 +65,7 @@ class DiscoveryService:
         _discover_via_cloud: Discover bridges using a cloud service.
         _discover_manually: Discover a bridge using a given IP address.
         _create_bridges_from_addresses: Create Bridge instances from IP addresses.
+        _fetch_bridge_data_isolated: Fetch bridge data on a worker-private repository.
         _filter_supported_bridges: Filter bridges that support streaming.
         _does_support_streaming_data: Check if a bridge supports streaming.
         _load_bridge_data: Load saved bridge data from a file.
@@ -50,6 +75,8 @@ class DiscoveryService:
     _CLOUD_URL = "https://discovery.meethue.com/"
     _MDNS_NAME = "_hue._tcp.local."
     _MIN_SWVERSION = 1948086000
+    _MDNS_TIMEOUT = 10.0
+    _MDNS_QUIET_WINDOW = 0.15
 
     def __init__(self, mdns_service: Mdns, bridge_repository: BridgeRepository):
         """
@@ -62,6 +89,7 @@ class DiscoveryService:
 
         self._mdns_service = mdns_service
         self._bridge_repository = bridge_repository
+        self._session = requests.Session()
 
     def discover(self, ip_address: Optional[str] = None) -> dict[str, Bridge] | list:
         """
@@ -115,7 +143,7 @@ class DiscoveryService:
         logging.info("Discovering bridge/s via mDNS")
         with Zeroconf() as zconf:
             ServiceBrowser(zconf, self._MDNS_NAME, self._mdns_service)
-            has_found_addresses = self._mdns_service.get_service_discovered().wait(timeout=10)
+            has_found_addresses = self._wait_for_mdns_addresses()
             if not has_found_addresses:
                 raise ValueError("No Hue bridges found via mDNS.")
 
@@ -129,6 +157,36 @@ class DiscoveryService:
         logging.info("Discovered IPs: %s", ip_addresses)
         return self._create_bridges_from_addresses(ip_addresses)
 
+    def _wait_for_mdns_addresses(self) -> bool:
+        """
+        Waits for mDNS responses with escalating poll intervals instead of a fixed timeout.
+
+        Bridges on a LAN usually answer within tens of milliseconds, so the wait polls at
+        increasing intervals up to the overall _MDNS_TIMEOUT and, once a first address arrives,
+        lingers only for a short quiet window to let any further bridges announce themselves.
+
+        Returns:
+            bool: True if at least one service was discovered within the timeout, False otherwise.
+        """
+
+        discovered = self._mdns_service.get_service_discovered()
+        deadline = time.monotonic() + self._MDNS_TIMEOUT
+        interval = 0.2
+        while not discovered.wait(timeout=interval):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            interval = min(interval * 2, 3.2, remaining)
+
+        address_count = len(self._mdns_service.get_addresses())
+        while time.monotonic() < deadline:
+            time.sleep(self._MDNS_QUIET_WINDOW)
+            new_count = len(self._mdns_service.get_addresses())
+            if new_count == address_count:
+                break
+            address_count = new_count
+        return True
+
     def _discover_via_cloud(self) -> list[Bridge]:
         """
         Discover bridges using Philips Hue's cloud discovery service.
@@ -141,8 +199,8 @@ class DiscoveryService:
         """
 
         logging.info("Discovering bridge/s via Hue Cloud")
-        response = requests.get(self._CLOUD_URL, timeout=5)
-        if response.status_code != StatusCode.OK.value:
+        response = self._session.get(self._CLOUD_URL, timeout=5)
+        if response.status_code != _STATUS_OK:
             raise BridgeException(f"Response status: {response.status_code}, {response.reason}")
 
         addresses = [config["internalipaddress"] for config in response.json()]
@@ -174,15 +232,79 @@ class DiscoveryService:
             list[Bridge]: A list of Bridge instances created from the given IP addresses.
         """
 
+        if not addresses:
+            return []
+
         bridges = []
+        to_fetch = []
         for address in addresses:
-            bridge_data = self._bridge_repository.fetch_bridge_data(address)
+            cached_bridge = self._cached_bridge(address)
+            if cached_bridge is not None:
+                logging.info("Reusing saved bridge data for %s", address)
+                bridges.append(cached_bridge)
+            else:
+                to_fetch.append(address)
+
+        if not to_fetch:
+            return bridges
+
+        if len(to_fetch) == 1:
+            bridge_data_list = [self._bridge_repository.fetch_bridge_data(to_fetch[0])]
+        else:
+            # Each fetch is a series of I/O-bound round trips to a different bridge, so enrich
+            # the addresses concurrently; executor.map keeps the results in input order. The
+            # repository stores its target base URL and session headers on the instance, so the
+            # shared repository cannot serve several addresses at once and each worker gets a
+            # private one instead.
+            with ThreadPoolExecutor(max_workers=min(len(to_fetch), 8)) as executor:
+                bridge_data_list = list(
+                    executor.map(self._fetch_bridge_data_isolated, to_fetch)
+                )
+
+        for bridge_data in bridge_data_list:
             bridge = Bridge.from_dict(bridge_data)
             if bridge:
                 FileHandler.write_json(FileHandler.BRIDGE_FILE_PATH, bridge.to_dict())
                 bridges.append(bridge)
         return bridges
 
+    @staticmethod
+    def _fetch_bridge_data_isolated(address: str) -> dict:
+        """
+        Fetches bridge data for one address on a repository private to the calling worker.
+
+        The registration and bridge data caches live on the BridgeRepository class, so the
+        throwaway instance still benefits from (and feeds) the shared caches.
+
+        Parameters:
+            address (str): The IP address of the bridge to enrich.
+
+        Returns:
+            dict: The fetched bridge data.
+        """
+
+        return BridgeRepository().fetch_bridge_data(address)
+
+    def _cached_bridge(self, address: str) -> Optional[Bridge]:
+        """
+        Looks up a previously saved bridge record matching the given IP address.
+
+        Parameters:
+            address (str): The IP address to look for in the saved bridge data.
+
+        Returns:
+            Optional[Bridge]: The saved Bridge for that address, or None when no usable record exists.
+        """
+
+        try:
+            saved_bridges = self._load_bridge_data()
+        except (FileNotFoundError, ValueError, json.JSONDecodeError):
+            return None
+        for bridge in saved_bridges:
+            if bridge.get_ip_address() == address:
+                return bridge
+        return None
+
     def _filter_supported_bridges(self, bridges: list[Bridge]) -> list[Bridge]:
         """
         Filters the given list of bridges to only include those that support streaming.
@@ -229,12 +351,17 @@ class DiscoveryService:
 
         logging.info("Attempting to load bridge data from a file")
         try:
-            data = FileHandler.read_json(FileHandler.BRIDGE_FILE_PATH)
-            if isinstance(data, list):
+            try:
+                mtime_ns = os.stat(FileHandler.BRIDGE_FILE_PATH).st_mtime_ns
+            except OSError:
+                data = FileHandler.read_json(FileHandler.BRIDGE_FILE_PATH)
+            else:
+                data = _read_bridge_file(FileHandler.BRIDGE_FILE_PATH, mtime_ns)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
                 logging.debug("data read: %s", data)
+            if isinstance(data, list):
                 return [Bridge.from_dict(bridge_data) for bridge_data in data]
             if isinstance(data, dict):
-                logging.debug("data read: %s", data)
                 return [Bridge.from_dict(data)]
             raise ValueError("Invalid data format in bridge data file")
         except FileNotFoundError as e:
@@ -243,7 +370,7 @@ class DiscoveryService:
     @classmethod
     def _is_valid_ip(cls, ip_address):
         """
-        Validates the format of an IP address using a regular expression.
+        Validates the format of an IP address by checking its four decimal octets.
 
         Parameters:
             ip_address (str): The IP address to be validated.
@@ -251,10 +378,15 @@ class DiscoveryService:
         Returns:
             bool: True if the IP address is in a valid format, False otherwise.
         """
-        pattern = (
-            r"^(?!0\d)(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\."
-            r"(?!0\d)(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\."
-            r"(?!0\d)(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\."
-            r"(?!0\d)(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-        )
-        return re.match(pattern, ip_address) is not None
+
+        parts = ip_address.split(".")
+        if len(parts) != 4:
+            return False
+        for part in parts:
+            if (
+                not (part.isascii() and part.isdigit())
+                or (len(part) > 1 and part[0] == "0")
+                or int(part) > 255
+            ):
+                return False
+        return True
@@ -38,7 +38,7 @@ class StreamingService:
 
     _KEEP_ALIVE_INTERVAL = 9.5
     _DEFAULT_CHANNEL_VALUE = struct.pack(">B", 0x00)
-    _COLOR_SPACE = ["rgb", "xyb"]
+    _COLOR_SPACE = frozenset({"rgb", "xyb"})
 
     def __init__(
         self,
@@ -72,6 +72,11 @@ class StreamingService:
 
         self._channel_data = b""
         self._last_message = self._init_message()
+        self._last_input: Union[
+            tuple[tuple[int, int, int], int],
+            tuple[tuple[float, float, float], int],
+            None,
+        ] = None
         self._is_connection_alive = False
 
         self._input_queue = queue.Queue()
@@ -179,6 +184,36 @@ class StreamingService:
                 "Invalid input: values must be a valid rgb8 (0 - 255) or xyb (0.0 - 1.0)"
             )
 
+    def set_inputs(
+        self,
+        user_inputs: list[
+            Union[tuple[int, int, int, int], tuple[float, float, float, int]]
+        ],
+    ):
+        """Sets color data for several lights at once.
+
+        The HueStream protocol carries up to 20 channels per message, so queuing the inputs together
+        lets all of them travel in a single datagram instead of one message per light.
+
+        Args:
+            user_inputs (list[Union[tuple[int, int, int, int], tuple[float, float, float, int]]]): A list of
+            per-light input tuples in the same RGB8 or XYB format accepted by set_input.
+        """
+
+        valid_inputs = []
+        for user_input in user_inputs:
+            rx, gy, bb, light_id = user_input
+            color = rx, gy, bb
+            logging.info("Setting color(%s, %s, %s) on light %s", rx, gy, bb, light_id)
+            if self._is_valid_rgb8(color) or self._is_valid_xyb(color):
+                valid_inputs.append(user_input)
+            else:
+                logging.error(
+                    "Invalid input: values must be a valid rgb8 (0 - 255) or xyb (0.0 - 1.0)"
+                )
+        if valid_inputs:
+            self._input_queue.put(valid_inputs)
+
     def _build_message(self, channel_data):
         """Constructs a message for streaming with the given channel data.
 
@@ -294,9 +329,25 @@ class StreamingService:
 
         Args:
             user_input: The user input to process. The input is expected to be a tuple of either
-            RGB8 or XYB color values along with a light identifier.
+            RGB8 or XYB color values along with a light identifier, or a list of such tuples queued
+            by set_inputs, which is sent as one batched message.
         """
 
+        if isinstance(user_input, list):
+            entries = []
+            for single_input in user_input:
+                if len(single_input) != 4:
+                    raise ValueError(f"{single_input} invalid input. Expected 4 values.")
+                rx, gy, bb, light_id = single_input
+                color = (rx, gy, bb)
+                if not (self._is_valid_rgb8(color) or self._is_valid_xyb(color)):
+                    raise ValueError(
+                        "Invalid input. Neither inputs are rgb8 or xyb compatible."
+                    )
+                entries.append((color, light_id))
+            self._send_colors_to_lights(entries)
+            return
+
         if len(user_input) != 4:
             raise ValueError(f"{user_input} invalid input. Expected 4 values.")
 
@@ -321,12 +372,56 @@ class StreamingService:
             value (int): An integer representing a specific value related to the light, such as its ID or channel.
 
         This method packages the color data and sends it over the DTLS connection to the specified light.
+        The packed message is rebuilt only when the input differs from the previous one, so repeated
+        identical inputs reuse the last message instead of re-packing it every frame.
         """
 
-        try:
+        if (color, value) == self._last_input:
+            message = self._last_message
+        else:
             self._channel_data = self._pack_color_data(color, value)
             message = self._build_message(self._channel_data)
-            logging.debug(message)
+
+        try:
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Streaming message: %r", message)
+            self._dtls_service.get_socket().sendto(
+                message,
+                (
+                    self._dtls_service.get_server_address()[0],
+                    self._dtls_service.get_server_address()[1],
+                ),
+            )
+            self._last_message = message
+            self._last_input = (color, value)
+        except SocketError as e:
+            logging.error("Error sending message: %s", e)
+            if self._is_connection_alive:
+                logging.info("Attempting to reconnect...")
+                self._attempt_reconnect()
+
+    def _send_colors_to_lights(
+        self,
+        entries: list[
+            Union[
+                tuple[tuple[int, int, int], int], tuple[tuple[float, float, float], int]
+            ]
+        ],
+    ):
+        """Sends color data for several lights in one streaming message.
+
+        Args:
+            entries (list): Pairs of color data and light identifier, packed together so that all
+            channels are updated by a single datagram rather than one message per light.
+        """
+
+        try:
+            self._channel_data = b"".join(
+                self._pack_color_data(color, value) for color, value in entries
+            )
+            message = self._build_message(self._channel_data)
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Streaming message: %r", message)
             self._dtls_service.get_socket().sendto(
                 message,
                 (
@@ -335,6 +430,7 @@ class StreamingService:
                 ),
             )
             self._last_message = message
+            self._last_input = None
         except SocketError as e:
             logging.error("Error sending message: %s", e)
             if self._is_connection_alive:
@@ -13,10 +13,11 @@ Class:
   storage and retrieval efficiently.
 """
 
-import json
 import os
 from typing import Any, Dict
 
+import orjson
+
 
 class FileHandler:
     """
@@ -53,8 +54,8 @@ class FileHandler:
             If the file does not exist, returns an empty dictionary.
         """
         if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                return json.load(file)
+            with open(file_path, "rb") as file:
+                return orjson.loads(file.read())
         raise FileNotFoundError(file_path)
 
     @staticmethod
@@ -63,12 +64,15 @@ class FileHandler:
         Writes a dictionary to a JSON file.
 
         If the directory in the file path does not exist, it is created. This method is primarily used to write
-        configuration and authentication data to a JSON file.
+        configuration and authentication data to a JSON file. The data is written to a temporary file first
+        and moved into place with os.replace, so readers never observe a partially written file.
 
         Parameters:
             file_path (str): The path to the JSON file where the data will be written.
             data (dict): The data to be written to the file, in dictionary format.
         """
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            file.write(orjson.dumps(data))
+        os.replace(tmp_path, file_path)
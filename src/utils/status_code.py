@@ -12,6 +12,7 @@ class StatusCode(Enum):
     OK = 200
     CREATED = 201
     MULTI_STATUS = 207
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
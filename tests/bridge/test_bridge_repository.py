@@ -16,6 +16,8 @@ import shutil
 import unittest
 from unittest.mock import patch, MagicMock
 
+import orjson
+
 from requests import Response
 
 from bridge.bridge_repository import BridgeRepository
@@ -35,7 +37,7 @@ class TestBridgeRepository(unittest.TestCase):
     software version, application ID, and bridge name.
 
     Attributes:
-        mock_request (MagicMock): A mock object for the requests.request function.
+        mock_request (MagicMock): A mock object for the requests.Session.request method.
         repo (BridgeRepository): An instance of the BridgeRepository class for testing.
 
     Methods:
@@ -58,7 +60,7 @@ class TestBridgeRepository(unittest.TestCase):
         Sets up the test environment by patching necessary functions and creating mock objects.
         """
 
-        self.mock_request_patcher = patch("requests.request")
+        self.mock_request_patcher = patch("requests.Session.request")
         self.mock_request = self.mock_request_patcher.start()
         self.mock_response = MagicMock(spec=Response)
         self.mock_response.status_code = StatusCode.OK.value
@@ -66,6 +68,11 @@ class TestBridgeRepository(unittest.TestCase):
         self.mock_response.headers = {"Content-Type": "application/json"}
         self.mock_request.return_value = self.mock_response
 
+        # The registration and bridge data caches live on the class and would otherwise leak
+        # between tests, making the suite order-dependent.
+        BridgeRepository._key_cache.clear()
+        BridgeRepository._bridge_data_cache.clear()
+
         self.repo = BridgeRepository()
         self.repo.set_base_url("")
 
@@ -169,9 +176,9 @@ class TestBridgeRepository(unittest.TestCase):
         self.mock_load_auth_data = patch.object(self.repo, "_load_auth_data").start()
         self.mock_save_auth_data = patch.object(self.repo, "_save_auth_data").start()
         self.mock_load_auth_data.return_value = {}
-        self.mock_response.json.return_value = [
-            {"success": {"username": "new_user", "clientkey": "new_key"}}
-        ]
+        self.mock_response.content = orjson.dumps(
+            [{"success": {"username": "new_user", "clientkey": "new_key"}}]
+        )
 
         username, client_key = self.repo._register_app_and_fetch_username_client_key()
         self.assertEqual(username, "new_user")
@@ -190,9 +197,9 @@ class TestBridgeRepository(unittest.TestCase):
         self.mock_load_auth_data = patch.object(self.repo, "_load_auth_data").start()
         self.mock_save_auth_data = patch.object(self.repo, "_save_auth_data").start()
         self.mock_load_auth_data.return_value = {}
-        self.mock_response.json.return_value = [
-            {"error": {"description": "registration failed"}}
-        ]
+        self.mock_response.content = orjson.dumps(
+            [{"error": {"description": "registration failed"}}]
+        )
 
         with self.assertRaises(BridgeException):
             self.repo._register_app_and_fetch_username_client_key()
@@ -202,7 +209,7 @@ class TestBridgeRepository(unittest.TestCase):
         Tests the _fetch_swversion method to verify it correctly fetches and returns the software version of the bridge.
         """
 
-        self.mock_response.json.return_value = {"swversion": "1935144040"}
+        self.mock_response.content = orjson.dumps({"swversion": "1935144040"})
         self.repo.set_base_url("testbaseurl.com")
 
         swversion = self.repo._fetch_swversion()
@@ -225,9 +232,9 @@ class TestBridgeRepository(unittest.TestCase):
         Tests the _fetch_bridge_name method to verify it correctly fetches and returns the name of the bridge.
         """
 
-        self.mock_response.json.return_value = {
-            "data": [{"metadata": {"name": "Hue Bridge"}}]
-        }
+        self.mock_response.content = orjson.dumps(
+            {"data": [{"metadata": {"name": "Hue Bridge"}}]}
+        )
         self.repo.set_base_url("testbaseurl.com")
 
         bridge_name = self.repo._fetch_bridge_name("0")
@@ -240,9 +247,9 @@ class TestBridgeRepository(unittest.TestCase):
         """
 
         self.repo.set_base_url("testbaseurl.com")
-        self.mock_response.json.return_value = {
-            "data": [{"id": "bridge-id", "owner": {"rid": "resource-id"}}]
-        }
+        self.mock_response.content = orjson.dumps(
+            {"data": [{"id": "bridge-id", "owner": {"rid": "resource-id"}}]}
+        )
 
         bridge_id, rid = self.repo._fetch_bridge_id_and_rid()
         self.assertEqual(bridge_id, "bridge-id")
@@ -254,9 +261,9 @@ class TestBridgeRepository(unittest.TestCase):
         """
 
         self.repo.set_base_url("testbaseurl.com")
-        self.mock_response.json.return_value = {
-            "data": [{"owner": {"rid": "resource-id"}}]
-        }
+        self.mock_response.content = orjson.dumps(
+            {"data": [{"owner": {"rid": "resource-id"}}]}
+        )
 
         rid = self.repo._fetch_bridge_rid()
         self.assertEqual(rid, "resource-id")
@@ -12,6 +12,8 @@ Classes:
 import unittest
 from unittest.mock import MagicMock, patch
 
+import orjson
+
 from bridge.entertainment_configuration_repository import (
     EntertainmentConfigurationRepository,
 )
@@ -58,7 +60,7 @@ class TestEntertainmentConfigurationRepository(unittest.TestCase):
         self.assertIn("Content-Type", self.repository._headers)
         self.assertIn("hue-application-key", self.repository._headers)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_send_request(self, mock_request):
         """
         Tests the _send_request method for both successful and unsuccessful HTTP request scenarios.
@@ -75,7 +77,7 @@ class TestEntertainmentConfigurationRepository(unittest.TestCase):
         with self.assertRaises(ApiException):
             self.repository._send_request("GET", "https://example.com")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_fetch_configurations(self, mock_request):
         """
         Tests the fetch_configurations method to ensure it correctly retrieves entertainment configurations from
@@ -84,14 +86,14 @@ class TestEntertainmentConfigurationRepository(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = ENTERTAINMENT_CONFIGURATION_MOCK
+        mock_response.content = orjson.dumps(ENTERTAINMENT_CONFIGURATION_MOCK)
         mock_request.return_value = mock_response
 
         configs = self.repository.fetch_configurations()
         self.assertIsInstance(list(configs.values())[0], EntertainmentConfiguration)
         self.assertEqual(len(configs), 1)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_put_configuration(self, mock_request):
         """
         Tests the put_configuration method to verify updating a specific entertainment configuration on
@@ -107,9 +109,7 @@ class TestEntertainmentConfigurationRepository(unittest.TestCase):
         mock_request.assert_called_with(
             "PUT",
             "https://192.168.1.2/clip/v2/resource/entertainment_configuration/1",
-            headers=self.repository._headers,
-            json={"name": "Updated Config"},
-            verify=False,
+            data=orjson.dumps({"name": "Updated Config"}),
             timeout=5,
         )
 
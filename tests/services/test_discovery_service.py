@@ -91,19 +91,23 @@ class TestDiscoveryService(unittest.TestCase):
             [call(bridge1), call(bridge2), call(bridge3)], any_order=True
         )
 
+    @patch("services.discovery_service.BridgeRepository")
     @patch("utils.file_handler.FileHandler.write_json")
     @patch("models.bridge.Bridge.from_dict")
     def test_create_bridges_from_addresses(
-        self, mock_bridge_from_dict, mock_write_json
+        self, mock_bridge_from_dict, mock_write_json, mock_repository_cls
     ):
         """
         Tests the _create_bridges_from_addresses method to verify creation of bridge instances from IP addresses.
+
+        Multiple addresses are fetched on worker-private repositories, so the fetches are mocked
+        through the BridgeRepository class rather than the repository injected in setUp.
         """
 
         test_addresses = ["192.168.1.3", "192.168.1.4"]
 
-        self.bridge_repository.fetch_bridge_data.side_effect = [
-            {
+        def fetch_bridge_data(address):
+            return {
                 "id": "id",
                 "rid": "rid",
                 "internalipaddress": address,
@@ -113,8 +117,10 @@ class TestDiscoveryService(unittest.TestCase):
                 "clientkey": "clientkey",
                 "name": "bridge",
             }
-            for address in test_addresses
-        ]
+
+        mock_repository_cls.return_value.fetch_bridge_data.side_effect = (
+            fetch_bridge_data
+        )
 
         mock_bridge1 = MagicMock(spec=Bridge)
         mock_bridge2 = MagicMock(spec=Bridge)
@@ -126,7 +132,7 @@ class TestDiscoveryService(unittest.TestCase):
         self.assertEqual(bridges[0], mock_bridge1)
         self.assertEqual(bridges[1], mock_bridge2)
 
-        self.bridge_repository.fetch_bridge_data.assert_has_calls(
+        mock_repository_cls.return_value.fetch_bridge_data.assert_has_calls(
             [call(address) for address in test_addresses], any_order=True
         )
 
@@ -188,13 +194,11 @@ class TestDiscoveryService(unittest.TestCase):
             self.assertEqual(len(bridges), 2)
             mock_zeroconf.assert_called_once()
             mock_service_browser.assert_called_once()
-            self.mdns_service.get_service_discovered().wait.assert_called_once_with(
-                timeout=10
-            )
-            self.mdns_service.get_addresses.assert_called_once()
+            self.mdns_service.get_service_discovered().wait.assert_called()
+            self.mdns_service.get_addresses.assert_called()
             mock_create.assert_called_once_with(["192.168.1.2"])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     @patch.object(DiscoveryService, "_create_bridges_from_addresses")
     def test_discover_via_cloud_success(self, mock_create_bridges, mock_get):
         """
@@ -214,7 +218,7 @@ class TestDiscoveryService(unittest.TestCase):
         mock_get.assert_called_once_with(self.discovery_service._CLOUD_URL, timeout=5)
         mock_create_bridges.assert_called_once_with(["192.168.1.2"])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_discover_via_cloud_failure(self, mock_get):
         """
         Tests the _discover_via_cloud method for a failure scenario in cloud-based discovery.
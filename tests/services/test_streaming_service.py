@@ -150,6 +150,64 @@ class TestStreamingService(unittest.TestCase):
                 log.output,
             )
 
+    def test_set_inputs_valid(self):
+        """
+        Tests that a list of valid inputs is queued as a single batch item.
+        """
+
+        valid_inputs = [(255, 0, 0, 0), (0, 255, 0, 1)]
+        self.streaming_service.set_inputs(valid_inputs)
+        self.assertEqual(self.streaming_service._input_queue.qsize(), 1)
+        self.assertEqual(self.streaming_service._input_queue.get(), valid_inputs)
+
+    def test_set_inputs_filters_invalid(self):
+        """
+        Tests that invalid entries are filtered out while valid ones are still queued together.
+        """
+
+        inputs = [(255, 0, 0, 0), (300, 255, 255, 1)]
+        with self.assertLogs(level="ERROR") as log:
+            self.streaming_service.set_inputs(inputs)
+            self.assertIn(
+                "ERROR:root:Invalid input: values must be a valid rgb8 (0 - 255) or xyb (0.0 - 1.0)",
+                log.output,
+            )
+        self.assertEqual(self.streaming_service._input_queue.qsize(), 1)
+        self.assertEqual(self.streaming_service._input_queue.get(), [(255, 0, 0, 0)])
+
+    def test_process_user_input_list(self):
+        """
+        Tests that the list branch of _process_user_input sends all entries as one batch.
+        """
+
+        entries = [(255, 0, 0, 0), (0, 0, 255, 1)]
+        with patch.object(
+            self.streaming_service, "_send_colors_to_lights"
+        ) as mock_send:
+            self.streaming_service._process_user_input(entries)
+            mock_send.assert_called_once_with([((255, 0, 0), 0), ((0, 0, 255), 1)])
+
+    def test_send_colors_to_lights(self):
+        """
+        Tests that _send_colors_to_lights packs all entries into a single datagram and resets
+        the last single-light input.
+        """
+
+        self.mock_dtls_service.get_server_address.return_value = ("192.168.1.1", 2100)
+        self.streaming_service._last_input = ((255, 255, 255), 0)
+
+        self.streaming_service._send_colors_to_lights(
+            [((255, 0, 0), 0), ((0, 0, 255), 1)]
+        )
+
+        mock_socket = self.mock_dtls_service.get_socket.return_value
+        mock_socket.sendto.assert_called_once()
+        message = mock_socket.sendto.call_args[0][0]
+        self.assertTrue(message.startswith(b"HueStream"))
+        header_length = 16 + len(self.streaming_service._entertainment_id)
+        self.assertEqual(len(message) - header_length, 2 * 7)
+        self.assertIsNone(self.streaming_service._last_input)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,11 +8,12 @@ Classes:
     TestFileHandler: A suite of unit tests for the FileHandler class.
 """
 
-import json
 import os
 import unittest
 from unittest.mock import patch, mock_open
 
+import orjson
+
 from src.utils.file_handler import FileHandler
 
 
@@ -41,9 +42,10 @@ class TestFileHandler(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             FileHandler.read_json(FileHandler.AUTH_FILE_PATH)
 
+    @patch("os.replace")
     @patch("os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
-    def test_write_json(self, mock_file, mock_makedirs):
+    def test_write_json(self, mock_file, mock_makedirs, mock_replace):
         """
         Tests the write_json method to ensure correct writing of JSON data to files and
         creation of necessary directories.
@@ -56,14 +58,15 @@ class TestFileHandler(unittest.TestCase):
             os.path.dirname(FileHandler.BRIDGE_FILE_PATH), exist_ok=True
         )
 
-        mock_file.assert_called_with(
-            FileHandler.BRIDGE_FILE_PATH, "w", encoding="utf-8"
+        mock_file.assert_called_with(f"{FileHandler.BRIDGE_FILE_PATH}.tmp", "wb")
+        mock_replace.assert_called_with(
+            f"{FileHandler.BRIDGE_FILE_PATH}.tmp", FileHandler.BRIDGE_FILE_PATH
         )
 
         handle = mock_file()
         written_data = handle.write.call_args_list
-        written_content = "".join(call_arg[0][0] for call_arg in written_data)
-        expected_content = json.dumps(data)
+        written_content = b"".join(call_arg[0][0] for call_arg in written_data)
+        expected_content = orjson.dumps(data)
         self.assertEqual(written_content, expected_content)
 
 